@@ -4,44 +4,24 @@ Generates realistic sample financial data and launches visualizations for demons
 """
 
 import pandas as pd
+import numpy as np
 import csv
-import os
-import random
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from pathlib import Path
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-
-class CSV:
-    CSV_FILE = "finance_data.csv"
-    COLUMNS = ["date", "amount", "category", "description"]
-    FORMAT = "%d-%m-%Y"
-
-    @classmethod
-    def initialize_csv(cls):
-        if not os.path.exists(cls.CSV_FILE) or os.path.getsize(cls.CSV_FILE) == 0:
-            df = pd.DataFrame(columns=cls.COLUMNS)
-            df.to_csv(cls.CSV_FILE, index=False)
-
-    @classmethod
-    def get_transactions_df(cls, start_date=None, end_date=None):
-        cls.initialize_csv()
-        df = pd.read_csv(cls.CSV_FILE)
-
-        if df.empty:
-            return df
-
-        df["date"] = pd.to_datetime(df["date"], format=cls.FORMAT, errors='coerce')
-        df = df.dropna(subset=["date"])
-
-        if start_date and end_date:
-            start = datetime.strptime(start_date, cls.FORMAT)
-            end = datetime.strptime(end_date, cls.FORMAT)
-            mask = (df["date"] >= start) & (df["date"] <= end)
-            df = df.loc[mask]
-
-        return df.sort_values("date")
+from main import (
+    DISPLAY_FORMAT,
+    ISO_FORMAT,
+    TransactionStore,
+    category_totals,
+    requires_data,
+    show_figure,
+)
 
 
 class DemoDataGenerator:
@@ -82,110 +62,159 @@ class DemoDataGenerator:
         ("Books/Courses", 20, 100),
     ]
 
+    MONTHLY_BILLS = [
+        (1, "Rent", 1200, 1800),
+        (5, "Electric Bill", 80, 150),
+        (10, "Internet", 60, 100),
+        (15, "Car Insurance", 100, 200),
+    ]
+
+    # Expenses that can occur on any day: everything not already billed monthly
+    DAILY_EXPENSE_POOL = tuple(
+        e for e in EXPENSE_CATEGORIES if e[0] not in {"Rent", "Electric Bill", "Internet", "Car Insurance"}
+    )
+
+    @staticmethod
+    def _draw_daily_expenses(rng, n_days, lows, highs):
+        """Draw 1-3 distinct expenses on ~70% of days; returns (day index, pool index, amount) arrays."""
+        active_days = np.flatnonzero(rng.random(n_days) > 0.3)
+        counts = rng.integers(1, 4, size=len(active_days))
+        # Ranking a row of random keys per day samples the pool without replacement
+        picks = rng.random((len(active_days), len(lows))).argsort(axis=1)[:, :3]
+        expense_idx = picks[np.arange(3) < counts[:, None]]
+        amounts = rng.uniform(lows[expense_idx], highs[expense_idx])
+        return np.repeat(active_days, counts), expense_idx, amounts
+
     @classmethod
-    def generate_sample_data(cls, months=6, filename="finance_data.csv"):
-        """Generate sample financial data for the specified number of months."""
-        transactions = []
+    def generate_sample_data(cls, months=6, filename="finance_data.csv", return_df=True):
+        """Generate sample financial data for the specified number of months.
+
+        Pass return_df=False when only the written file is needed.
+        """
+        rng = np.random.default_rng()
         today = datetime.today()
         start_date = today - timedelta(days=months * 30)
 
-        current_date = start_date
-
-        while current_date <= today:
-            # Monthly income (1st of month)
-            if current_date.day == 1:
-                # Primary salary
-                transactions.append({
-                    "date": current_date.strftime(CSV.FORMAT),
-                    "amount": round(random.uniform(4500, 5500), 2),
-                    "category": "Income",
-                    "description": "Salary"
-                })
-
-                # Random additional income (50% chance)
-                if random.random() > 0.5:
-                    source = random.choice(cls.INCOME_SOURCES[1:])
-                    transactions.append({
-                        "date": current_date.strftime(CSV.FORMAT),
-                        "amount": round(random.uniform(source[1], source[2]), 2),
-                        "category": "Income",
-                        "description": source[0]
-                    })
-
-            # Monthly bills (various days)
-            if current_date.day == 1:
-                transactions.append({
-                    "date": current_date.strftime(CSV.FORMAT),
-                    "amount": round(random.uniform(1200, 1800), 2),
-                    "category": "Expense",
-                    "description": "Rent"
-                })
-
-            if current_date.day == 5:
-                transactions.append({
-                    "date": current_date.strftime(CSV.FORMAT),
-                    "amount": round(random.uniform(80, 150), 2),
-                    "category": "Expense",
-                    "description": "Electric Bill"
-                })
-
-            if current_date.day == 10:
-                transactions.append({
-                    "date": current_date.strftime(CSV.FORMAT),
-                    "amount": round(random.uniform(60, 100), 2),
-                    "category": "Expense",
-                    "description": "Internet"
-                })
-
-            if current_date.day == 15:
-                transactions.append({
-                    "date": current_date.strftime(CSV.FORMAT),
-                    "amount": round(random.uniform(100, 200), 2),
-                    "category": "Expense",
-                    "description": "Car Insurance"
-                })
-
-            # Random daily expenses (70% chance each day)
-            if random.random() > 0.3:
-                num_expenses = random.randint(1, 3)
-                daily_expenses = random.sample(
-                    [e for e in cls.EXPENSE_CATEGORIES if e[0] not in ["Rent", "Electric Bill", "Internet", "Car Insurance"]],
-                    min(num_expenses, 5)
-                )
-
-                for expense in daily_expenses:
-                    transactions.append({
-                        "date": current_date.strftime(CSV.FORMAT),
-                        "amount": round(random.uniform(expense[1], expense[2]), 2),
-                        "category": "Expense",
-                        "description": expense[0]
-                    })
-
-            current_date += timedelta(days=1)
-
-        # Write to CSV
-        df = pd.DataFrame(transactions)
-        df.to_csv(filename, index=False)
-
-        print(f"✅ Generated {len(transactions)} transactions over {months} months")
+        dates = pd.date_range(start_date, today, freq="D", normalize=True)
+        blocks = []
+
+        # Monthly income (1st of month)
+        first_days = np.flatnonzero(dates.day == 1)
+        blocks.append((first_days, rng.uniform(4500, 5500, size=len(first_days)), "Income", "Salary"))
+
+        # Random additional income (50% chance)
+        extra_days = first_days[rng.random(len(first_days)) > 0.5]
+        sources = cls.INCOME_SOURCES[1:]
+        source_idx = rng.integers(0, len(sources), size=len(extra_days))
+        lows, highs = np.array([s[1:] for s in sources], dtype=float).T
+        names = np.array([s[0] for s in sources], dtype=object)
+        blocks.append((
+            extra_days, rng.uniform(lows[source_idx], highs[source_idx]), "Income", names[source_idx]
+        ))
+
+        # Monthly bills (various days)
+        for day, description, low, high in cls.MONTHLY_BILLS:
+            bill_days = np.flatnonzero(dates.day == day)
+            blocks.append((bill_days, rng.uniform(low, high, size=len(bill_days)), "Expense", description))
+
+        # Random daily expenses
+        lows, highs = np.array([e[1:] for e in cls.DAILY_EXPENSE_POOL], dtype=float).T
+        names = np.array([e[0] for e in cls.DAILY_EXPENSE_POOL], dtype=object)
+        expense_days, expense_idx, expense_amounts = cls._draw_daily_expenses(rng, len(dates), lows, highs)
+        blocks.append((expense_days, expense_amounts, "Expense", names[expense_idx]))
+
+        # Fill preallocated columns block by block instead of building a dict per row
+        total = sum(len(block[0]) for block in blocks)
+        days = np.empty(total, dtype=np.int64)
+        amounts = np.empty(total, dtype=np.float64)
+        categories = np.empty(total, dtype=object)
+        descriptions = np.empty(total, dtype=object)
+        offset = 0
+        for block_days, block_amounts, category, description in blocks:
+            end = offset + len(block_days)
+            days[offset:end] = block_days
+            amounts[offset:end] = block_amounts
+            categories[offset:end] = category
+            descriptions[offset:end] = description
+            offset = end
+
+        order = np.argsort(days, kind="stable")
+        day = days[order]
+        columns = {
+            "date": dates[day],
+            "amount": amounts[order].round(2),
+            "category": categories[order],
+            "description": descriptions[order]
+        }
+
+        # Write to Parquet or CSV
+        if Path(filename).suffix == ".parquet":
+            # Same schema as main.py's own writes, so reads return the same dtypes either way
+            TransactionStore(filename).write_parquet(pd.DataFrame(columns))
+        else:
+            # Format each calendar day and amount once, then stream rows straight from the arrays
+            date_strs = dates.strftime(ISO_FORMAT).to_numpy()[day]
+            amount_strs = np.char.mod("%.2f", columns["amount"])
+            with open(filename, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(columns)
+                writer.writerows(zip(date_strs, amount_strs, columns["category"], columns["description"]))
+
+        print(f"✅ Generated {len(day)} transactions over {months} months")
         print(f"📁 Saved to: {filename}")
 
-        return df
+        if return_df:
+            return pd.DataFrame(columns)
 
 
 class Visualizer:
     """Handles all Plotly visualizations for financial data."""
 
+    MAX_LINE_POINTS = 2000
+
     @staticmethod
-    def income_vs_expense_bar(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
+    def _downsample(df, y):
+        """Keep at most MAX_LINE_POINTS date-sorted rows of a line trace, chosen by MinMaxLTTB."""
+        if len(df) <= Visualizer.MAX_LINE_POINTS:
+            return df
+        # Imported here because plotly-resampler pulls in Dash, which would slow every launch
+        try:
+            from plotly_resampler.aggregation import MinMaxLTTB
+        except ImportError:  # plotly-resampler is optional; line charts then plot every point
+            return df
 
-        summary = df.groupby("category")["amount"].sum().reset_index()
+        idx = MinMaxLTTB().arg_downsample(
+            df["date"].values, df[y].values, n_out=Visualizer.MAX_LINE_POINTS
+        )
+        return df.iloc[idx]
+
+    @staticmethod
+    def _augment(df):
+        """Add the month, signed_amount and cumulative columns shared by several charts."""
+        if "cumulative" in df.columns:
+            return df
+
+        # Store reads are already date-sorted; a shallow copy is then enough to add columns
+        # without touching the caller's frame or duplicating its data
+        if df["date"].is_monotonic_increasing:
+            df = df.copy(deep=False)
+        else:
+            df = df.sort_values("date", kind="stable")
+        # Period months are int64-backed; charts stringify them only after grouping
+        df["month"] = df["date"].dt.to_period("M")
+        amounts = df["amount"].to_numpy()
+        df["signed_amount"] = np.where(df["category"].values == "Income", amounts, -amounts)
+        df["cumulative"] = df["signed_amount"].cumsum()
+        return df
+
+    @staticmethod
+    @requires_data
+    def income_vs_expense_bar(df, summary=None):
+        if summary is None:
+            summary = DemoState.summarize(df)
 
         fig = px.bar(
-            summary,
+            summary.reset_index(),
             x="category",
             y="amount",
             color="category",
@@ -194,39 +223,41 @@ class Visualizer:
             labels={"amount": "Amount ($)", "category": "Category"}
         )
         fig.update_layout(showlegend=False, template="plotly_dark")
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
+    @requires_data
     def spending_over_time(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
-
-        daily = df.groupby(["date", "category"])["amount"].sum().reset_index()
+        daily = df.groupby(["date", "category"], observed=True)["amount"].sum().reset_index()
+        daily = pd.concat(
+            Visualizer._downsample(cat_data, "amount")
+            for _, cat_data in daily.groupby("category", observed=True)
+        )
 
-        fig = px.line(
-            daily,
-            x="date",
-            y="amount",
-            color="category",
-            color_discrete_map={"Income": "#2ecc71", "Expense": "#e74c3c"},
+        # WebGL traces keep marker-heavy lines responsive in the browser
+        fig = go.Figure()
+        for cat, color in [("Income", "#2ecc71"), ("Expense", "#e74c3c")]:
+            cat_data = daily[daily["category"] == cat]
+            fig.add_trace(go.Scattergl(
+                x=cat_data["date"], y=cat_data["amount"],
+                mode="lines+markers", name=cat, line=dict(color=color)
+            ))
+        fig.update_layout(
             title="📈 Transactions Over Time",
-            labels={"amount": "Amount ($)", "date": "Date"},
-            markers=True
+            xaxis_title="Date",
+            yaxis_title="Amount ($)",
+            legend_title_text="category",
+            template="plotly_dark"
         )
-        fig.update_layout(template="plotly_dark")
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
+    @requires_data
     def monthly_summary(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
-
-        df = df.copy()
-        df["month"] = df["date"].dt.to_period("M").astype(str)
+        df = Visualizer._augment(df)
 
-        monthly = df.groupby(["month", "category"])["amount"].sum().reset_index()
+        monthly = df.groupby(["month", "category"], observed=True)["amount"].sum().reset_index()
+        monthly["month"] = monthly["month"].astype(str)
 
         fig = px.bar(
             monthly,
@@ -239,21 +270,17 @@ class Visualizer:
             labels={"amount": "Amount ($)", "month": "Month"}
         )
         fig.update_layout(template="plotly_dark")
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
+    @requires_data
     def expense_breakdown_pie(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
-
         expenses = df[df["category"] == "Expense"]
         if expenses.empty:
             print("No expense data to visualize.")
             return
 
-        by_desc = expenses.groupby("description")["amount"].sum().reset_index()
-        by_desc = by_desc.sort_values("amount", ascending=False).head(10)
+        by_desc = expenses.groupby("description", observed=True)["amount"].sum().nlargest(10).reset_index()
 
         fig = px.pie(
             by_desc,
@@ -263,41 +290,33 @@ class Visualizer:
             hole=0.4
         )
         fig.update_layout(template="plotly_dark")
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
+    @requires_data
     def cumulative_savings(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
-
-        df = df.copy().sort_values("date")
-        df["signed_amount"] = df.apply(
-            lambda row: row["amount"] if row["category"] == "Income" else -row["amount"],
-            axis=1
-        )
-        df["cumulative"] = df["signed_amount"].cumsum()
-
-        fig = px.area(
-            df,
-            x="date",
-            y="cumulative",
+        df = Visualizer._downsample(Visualizer._augment(df), "cumulative")
+
+        # Plotly embeds arrays in their own dtype, so float32 halves the plotted y payload
+        fig = go.Figure(go.Scattergl(
+            x=df["date"], y=df["cumulative"].to_numpy(dtype=np.float32),
+            mode="lines", fill="tozeroy",
+            line=dict(color="#3498db"), fillcolor="rgba(52, 152, 219, 0.3)"
+        ))
+        fig.update_layout(
             title="📈 Cumulative Savings Over Time",
-            labels={"cumulative": "Savings ($)", "date": "Date"}
+            xaxis_title="Date",
+            yaxis_title="Savings ($)",
+            template="plotly_dark"
         )
-        fig.update_traces(line_color="#3498db", fillcolor="rgba(52, 152, 219, 0.3)")
-        fig.update_layout(template="plotly_dark")
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
+    @requires_data
     def top_expenses_bar(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
-
         expenses = df[df["category"] == "Expense"]
-        by_desc = expenses.groupby("description")["amount"].sum().reset_index()
-        by_desc = by_desc.sort_values("amount", ascending=True).tail(10)
+        # Ascending order so the largest expense is drawn at the top of the horizontal bar
+        by_desc = expenses.groupby("description", observed=True)["amount"].sum().nlargest(10)[::-1].reset_index()
 
         fig = px.bar(
             by_desc,
@@ -310,25 +329,21 @@ class Visualizer:
             color_continuous_scale="Reds"
         )
         fig.update_layout(template="plotly_dark", showlegend=False)
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
+    @requires_data
     def dashboard(df):
-        if df.empty:
-            print("No data to visualize.")
-            return
-
-        df = df.copy()
-        df["month"] = df["date"].dt.to_period("M").astype(str)
-        df["signed_amount"] = df.apply(
-            lambda row: row["amount"] if row["category"] == "Income" else -row["amount"],
-            axis=1
-        )
-        df_sorted = df.sort_values("date").copy()
-        df_sorted["cumulative"] = df_sorted["signed_amount"].cumsum()
-
-        total_income = df[df["category"] == "Income"]["amount"].sum()
-        total_expense = df[df["category"] == "Expense"]["amount"].sum()
+        df = Visualizer._augment(df)
+
+        # One grouping pass; the month x category pivot (header totals, totals bar, monthly bars)
+        # and the expense breakdown are both marginals of it
+        grouped = df.groupby(["month", "category", "description"], observed=True, dropna=False)["amount"].sum()
+        pivot = grouped.groupby(level=["month", "category"], observed=True).sum().unstack(fill_value=0)
+        pivot.index = pivot.index.astype(str)
+        summary = pivot.sum()
+        total_income = summary.get("Income", 0)
+        total_expense = summary.get("Expense", 0)
         net_savings = total_income - total_expense
 
         fig = make_subplots(
@@ -348,17 +363,17 @@ class Visualizer:
         )
 
         # Income vs Expense
-        summary = df.groupby("category")["amount"].sum().reset_index()
-        colors = ["#2ecc71" if c == "Income" else "#e74c3c" for c in summary["category"]]
+        colors = ["#2ecc71" if c == "Income" else "#e74c3c" for c in summary.index]
         fig.add_trace(
-            go.Bar(x=summary["category"], y=summary["amount"], marker_color=colors, name="Total"),
+            go.Bar(x=summary.index, y=summary.values, marker_color=colors, name="Total"),
             row=1, col=1
         )
 
         # Cumulative savings
+        savings = Visualizer._downsample(df, "cumulative")
         fig.add_trace(
-            go.Scatter(
-                x=df_sorted["date"], y=df_sorted["cumulative"],
+            go.Scattergl(
+                x=savings["date"], y=savings["cumulative"].to_numpy(dtype=np.float32),
                 mode="lines", name="Savings",
                 line=dict(color="#3498db", width=2), fill="tozeroy",
                 fillcolor="rgba(52, 152, 219, 0.3)"
@@ -367,19 +382,17 @@ class Visualizer:
         )
 
         # Monthly breakdown
-        monthly = df.groupby(["month", "category"])["amount"].sum().reset_index()
+        monthly = pivot.reindex(columns=["Income", "Expense"], fill_value=0)
         for cat, color in [("Income", "#2ecc71"), ("Expense", "#e74c3c")]:
-            cat_data = monthly[monthly["category"] == cat]
             fig.add_trace(
-                go.Bar(x=cat_data["month"], y=cat_data["amount"], name=cat, marker_color=color),
+                go.Bar(x=monthly.index, y=monthly[cat].values, name=cat, marker_color=color),
                 row=2, col=1
             )
 
         # Expense pie
-        expenses = df[df["category"] == "Expense"]
+        expenses = grouped[grouped.index.get_level_values("category") == "Expense"]
         if not expenses.empty:
-            by_desc = expenses.groupby("description")["amount"].sum().reset_index()
-            by_desc = by_desc.sort_values("amount", ascending=False).head(8)
+            by_desc = expenses.groupby(level="description").sum().nlargest(8).reset_index()
             fig.add_trace(
                 go.Pie(
                     labels=by_desc["description"],
@@ -399,21 +412,43 @@ class Visualizer:
             showlegend=True,
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
         )
-        fig.show()
+        show_figure(fig)
 
 
-def print_summary(df):
+@dataclass
+class DemoState:
+    """Transactions loaded once per demo session, plus aggregates shared across charts."""
+    df: pd.DataFrame
+    summary: pd.Series
+
+    @staticmethod
+    def summarize(df):
+        """Total amount per category."""
+        return category_totals(df)
+
+    @classmethod
+    def load(cls, store):
+        df = store.get_transactions_df()
+        if not df.empty:
+            df = Visualizer._augment(df)
+        return cls(df=df, summary=cls.summarize(df))
+
+
+def print_summary(df, summary=None):
     """Print a text summary of the financial data."""
     if df.empty:
         print("No data available.")
         return
 
-    total_income = df[df["category"] == "Income"]["amount"].sum()
-    total_expense = df[df["category"] == "Expense"]["amount"].sum()
+    if summary is None:
+        summary = DemoState.summarize(df)
+
+    total_income = summary.get("Income", 0)
+    total_expense = summary.get("Expense", 0)
     net_savings = total_income - total_expense
 
     num_transactions = len(df)
-    date_range = f"{df['date'].min().strftime('%d-%m-%Y')} to {df['date'].max().strftime('%d-%m-%Y')}"
+    date_range = f"{df['date'].min().strftime(DISPLAY_FORMAT)} to {df['date'].max().strftime(DISPLAY_FORMAT)}"
 
     print("\n" + "=" * 50)
     print("📊 FINANCIAL SUMMARY")
@@ -431,26 +466,29 @@ def print_summary(df):
     print("=" * 50)
 
     # Top 5 expenses
-    expenses = df[df["category"] == "Expense"]
-    if not expenses.empty:
-        top_expenses = expenses.groupby("description")["amount"].sum().sort_values(ascending=False).head(5)
+    if summary.get("Expense", 0) > 0:
+        expenses = df[df["category"] == "Expense"]
+        top_expenses = expenses.groupby("description", observed=True)["amount"].sum().nlargest(5)
         print("\n🔝 Top 5 Expense Categories:")
         for i, (desc, amt) in enumerate(top_expenses.items(), 1):
             print(f"   {i}. {desc}: ${amt:,.2f}")
 
 
-def demo_menu():
-    """Interactive demo menu."""
+def demo_menu(store=None):
+    """Interactive demo menu; uses main.py's default data file unless a store is given."""
+    if store is None:
+        store = TransactionStore()
     print("\n" + "=" * 50)
     print("🎬 FINANCE TRACKER DEMO")
     print("=" * 50)
 
     # Check if data exists
-    if not os.path.exists("finance_data.csv") or os.path.getsize("finance_data.csv") == 0:
+    if store.is_empty():
         print("\n📊 No data found. Generating sample data...")
-        DemoDataGenerator.generate_sample_data(months=6)
+        DemoDataGenerator.generate_sample_data(months=6, filename=store.filepath, return_df=False)
 
-    df = CSV.get_transactions_df()
+    state = DemoState.load(store)
+    df = state.df
 
     while True:
         print("\n--- Demo Menu ---")
@@ -470,14 +508,15 @@ def demo_menu():
         if choice == "1":
             months = input("How many months of data? (default: 6): ").strip()
             months = int(months) if months.isdigit() else 6
-            DemoDataGenerator.generate_sample_data(months=months)
-            df = CSV.get_transactions_df()
+            DemoDataGenerator.generate_sample_data(months=months, filename=store.filepath, return_df=False)
+            state = DemoState.load(store)
+            df = state.df
 
         elif choice == "2":
-            print_summary(df)
+            print_summary(df, state.summary)
 
         elif choice == "3":
-            Visualizer.income_vs_expense_bar(df)
+            Visualizer.income_vs_expense_bar(df, state.summary)
 
         elif choice == "4":
             Visualizer.spending_over_time(df)
@@ -506,4 +545,5 @@ def demo_menu():
 
 
 if __name__ == "__main__":
-    demo_menu()
\ No newline at end of file
+    # Uses the same data file as main.py; pass a path (e.g. finance_data.parquet) to pick another
+    demo_menu(TransactionStore(*sys.argv[1:2]))
\ No newline at end of file
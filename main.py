@@ -1,14 +1,34 @@
+import atexit
+import contextlib
 import csv
+import os
+import re
+import shutil
+import sys
+import tempfile
+import webbrowser
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from functools import wraps
+from functools import cached_property, wraps
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for .parquet stores and faster CSV reads
+    pa = pq = None
+
+# pyarrow's multithreaded CSV reader releases the GIL; the C parser is the fallback
+CSV_ENGINE = "c" if pa is None else "pyarrow"
+
 
 class Category(Enum):
     INCOME = "Income"
@@ -22,7 +42,17 @@ COLORS = {
     "savings": "#3498db",
 }
 
-DATE_FORMAT = "%d-%m-%Y"
+# Two fixed categories, so comparisons and groupbys run on int8 codes instead of strings
+CATEGORY_DTYPE = pd.CategoricalDtype([c.value for c in Category])
+
+# Dates are entered and shown as dd-mm-yyyy but stored as ISO 8601, which pandas parses natively
+DISPLAY_FORMAT = "%d-%m-%Y"
+ISO_FORMAT = "%Y-%m-%d"
+# Matches DISPLAY_FORMAT input (day and month may omit the leading zero, as strptime allows)
+DATE_RE = re.compile(r"^(\d{1,2})-(\d{1,2})-(\d{4})$")
+
+# Rows per Parquet row group; date-sorted groups let range filters skip whole groups
+PARQUET_ROW_GROUP_SIZE = 1000
 
 
 def requires_data(func):
@@ -36,49 +66,279 @@ def requires_data(func):
     return wrapper
 
 
+def show_figure(fig):
+    """Opens a figure in the browser as a standalone HTML page that loads plotly.js from the CDN.
+
+    Unlike fig.show(), this skips re-validating the whole figure and keeps each page a few KB
+    instead of embedding the full plotly.js bundle.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False, encoding="utf-8") as f:
+        pio.write_html(fig, f, include_plotlyjs="cdn", validate=False)
+    webbrowser.open(Path(f.name).as_uri())
+
+
+def category_totals(df):
+    """Income and expense totals as a Series, from two masked sums rather than a groupby."""
+    amounts = df["amount"].to_numpy()
+    # Comparing the Categorical column checks its int8 codes, not one string per row
+    totals = {c.value: amounts[(df["category"] == c.value).to_numpy()].sum() for c in Category}
+    return pd.Series(totals, name="amount").rename_axis("category")
+
+
 class TransactionStore:
-    """Handles CSV storage and retrieval of financial transactions."""
+    """Handles CSV or Parquet (a .parquet filepath) storage and retrieval of financial transactions."""
 
     def __init__(self, filepath="finance_data.csv"):
         self.filepath = Path(filepath)
         self.columns = ["date", "amount", "category", "description"]
+        self.dtypes = {"amount": "float64", "category": CATEGORY_DTYPE, "description": "string"}
+        self.is_parquet = self.filepath.suffix == ".parquet"
+        if self.is_parquet and pq is None:
+            raise ImportError("pyarrow is required for Parquet storage: pip install pyarrow")
+        # ((st_mtime_ns, st_size), parsed DataFrame) for the last CSV version read
+        self._cache = None
+        # Append handle and writer, opened on the first CSV write and reused after that
+        self._append_fh = None
+        self._csv_writer = None
+        # ISO date of the newest CSV row ("" when empty), read once and then tracked on write
+        self._last_date = None
+
+    @staticmethod
+    def _parquet_schema():
+        return pa.schema([
+            ("date", pa.timestamp("ns")),
+            ("amount", pa.float64()),
+            ("category", pa.dictionary(pa.int8(), pa.string())),
+            ("description", pa.string()),
+        ])
+
+    def is_empty(self):
+        """True if the data file is missing or has no bytes, checked with a single stat call."""
+        try:
+            return self.filepath.stat().st_size == 0
+        except FileNotFoundError:
+            return True
 
     def initialize(self):
-        if not self.filepath.exists() or self.filepath.stat().st_size == 0:
-            df = pd.DataFrame(columns=self.columns)
-            df.to_csv(self.filepath, index=False)
+        if self.is_empty():
+            if self.is_parquet:
+                pq.write_table(self._parquet_schema().empty_table(), self.filepath)
+            else:
+                df = pd.DataFrame(columns=self.columns)
+                df.to_csv(self.filepath, index=False)
             print(f"Initialized {self.filepath}")
 
     def add_entry(self, date, amount, category, description):
         new_entry = {
-            "date": date,
+            "date": datetime.strptime(date, DISPLAY_FORMAT).date().isoformat(),
             "amount": amount,
             "category": category,
             "description": description,
         }
-        with open(self.filepath, "a", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.columns)
-            writer.writerow(new_entry)
+        self.add_entries([new_entry])
         print("Entry added successfully")
 
-    def get_transactions_df(self, start_date=None, end_date=None):
-        """Returns a DataFrame of transactions, optionally filtered by date range."""
+    def add_entries(self, entries):
+        """Writes many entries (dicts with ISO dates) in one pass: one Parquet rewrite, or one CSV flush."""
+        entries = list(entries)
+        if not entries:
+            return
         self.initialize()
-        df = pd.read_csv(self.filepath)
+        if self.is_parquet:
+            self._append_parquet(entries)
+        else:
+            self._write_csv(entries)
+        self._cache = None
+
+    def _write_csv(self, entries):
+        """Keeps the CSV in date order so reads never need to sort it."""
+        self._drop_stale_handle()
+        dates = [entry["date"] for entry in entries]
+        last_date = self._last_csv_date()
+        # ISO strings compare in date order
+        if dates == sorted(dates) and dates[0] >= last_date:
+            # The common case, entries dated on or after the newest row: a plain append
+            self._writer().writerows(entries)
+            # Flush so the next read (and its stat-based cache key) sees the new rows
+            self._append_fh.flush()
+        else:
+            self._rewrite_csv_sorted(entries)
+        self._last_date = max(last_date, *dates)
+
+    def _last_csv_date(self):
+        if self._last_date is None:
+            dates = self._load_csv()["date"]
+            self._last_date = dates.max().strftime(ISO_FORMAT) if not dates.empty else ""
+        return self._last_date
+
+    def _rewrite_csv_sorted(self, entries):
+        """Merges back-dated entries into place by rewriting the whole file, dates normalized to ISO."""
+        raw = pd.read_csv(self.filepath, dtype=str, keep_default_na=False)
+        new = pd.DataFrame(entries, columns=self.columns).fillna("").astype(str)
+        raw = pd.concat([raw, new], ignore_index=True)
+        dates = self._parse_dates(raw["date"])
+        raw["date"] = dates.dt.strftime(ISO_FORMAT).fillna(raw["date"])
+        # Stable, and rows with unreadable dates sort last instead of being dropped
+        order = np.argsort(dates.to_numpy(), kind="stable")
+        self._replace_file(lambda path: raw.iloc[order].to_csv(path, index=False))
+        # The append handle still points at the replaced file; the next append reopens it
+        self.close()
+
+    def _drop_stale_handle(self):
+        """Closes the append handle if the file was replaced on disk (e.g. an editor saving by rename)."""
+        if self._append_fh is None:
+            return
+        opened = os.fstat(self._append_fh.fileno())
+        current = self.filepath.stat()
+        if (opened.st_dev, opened.st_ino) != (current.st_dev, current.st_ino):
+            self.close()
+            # The replacement may hold different rows, so the newest date is re-read
+            self._last_date = None
+
+    def _writer(self):
+        """Lazily opens the buffered append handle shared by all CSV writes."""
+        if self._append_fh is None:
+            self._append_fh = open(self.filepath, "a", newline="", buffering=1 << 16)
+            self._csv_writer = csv.DictWriter(self._append_fh, fieldnames=self.columns)
+            atexit.register(self.close)
+        return self._csv_writer
+
+    def close(self):
+        """Closes the CSV append handle, if one is open."""
+        if self._append_fh is not None:
+            self._append_fh.close()
+            self._append_fh = self._csv_writer = None
+            atexit.unregister(self.close)
+
+    def _append_parquet(self, entries):
+        """Parquet files are immutable, so appending rewrites the file sorted by date."""
+        schema = self._parquet_schema()
+        rows = [
+            {
+                **entry,
+                "date": datetime.strptime(entry["date"], ISO_FORMAT),
+                # Match CSV storage, where an empty description reads back as missing
+                "description": entry["description"] or None,
+            }
+            for entry in entries
+        ]
+        table = pa.concat_tables([
+            pq.read_table(self.filepath).cast(schema),
+            pa.Table.from_pylist(rows, schema=schema),
+        ])
+        self._write_parquet_table(table.unify_dictionaries().sort_by("date"))
+
+    def write_parquet(self, df):
+        """Replaces the Parquet file with df, converted to the store's schema and sorted by date."""
+        df = df[self.columns].astype({"category": CATEGORY_DTYPE})
+        table = pa.Table.from_pandas(df, schema=self._parquet_schema(), preserve_index=False)
+        self._write_parquet_table(table.sort_by("date"))
+        self._cache = None
+
+    def _write_parquet_table(self, table):
+        self._replace_file(lambda path: pq.write_table(
+            table, path, compression="snappy", row_group_size=PARQUET_ROW_GROUP_SIZE
+        ))
+
+    def _replace_file(self, write):
+        """Writes a new version of the store to a temp file beside it, then swaps it in.
+
+        An interrupted write leaves the old file intact instead of a truncated one.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.filepath.parent, prefix=f".{self.filepath.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            write(tmp)
+            with open(tmp, "rb+") as f:
+                os.fsync(f.fileno())
+            if self.filepath.exists():
+                shutil.copymode(self.filepath, tmp)
+            os.replace(tmp, self.filepath)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
 
-        if df.empty:
+    def get_transactions_df(self, start_date=None, end_date=None):
+        """Returns a DataFrame of transactions, optionally filtered by date range."""
+        start = end = None
+        if start_date and end_date:
+            start = datetime.strptime(start_date, DISPLAY_FORMAT)
+            end = datetime.strptime(end_date, DISPLAY_FORMAT)
+
+        if self.is_parquet:
+            self.initialize()
+            # Dates are stored as timestamps; the range filter is pushed down to the row groups
+            filters = [("date", ">=", start), ("date", "<=", end)] if start else None
+            df = pq.read_table(self.filepath, filters=filters).to_pandas()
+            df["category"] = df["category"].astype(CATEGORY_DTYPE)
+            # Written sorted by _append_parquet; only files from elsewhere need sorting here
+            if not df["date"].is_monotonic_increasing:
+                df = df.sort_values("date", kind="stable")
             return df
 
-        df["date"] = pd.to_datetime(df["date"], format=DATE_FORMAT, errors="coerce")
-        df = df.dropna(subset=["date"])
+        df = self._load_csv()
 
-        if start_date and end_date:
-            start = datetime.strptime(start_date, DATE_FORMAT)
-            end = datetime.strptime(end_date, DATE_FORMAT)
-            mask = (df["date"] >= start) & (df["date"] <= end)
-            df = df.loc[mask]
+        if df.empty or start is None:
+            # A shallow copy: callers may add columns without touching the cached frame,
+            # and no column data is duplicated
+            return df.copy(deep=False)
+
+        # The frame is date-sorted, so the range is one contiguous slice found by binary search
+        dates = df["date"].to_numpy()
+        lo = np.searchsorted(dates, np.datetime64(start), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end), side="right")
+        return df.iloc[lo:hi]
+
+    def _load_csv(self):
+        """Parses the CSV once per file version; later calls reuse the cached frame.
 
-        return df.sort_values("date")
+        A cache hit costs a single stat call, which also covers the missing/empty check.
+        """
+        try:
+            stat = self.filepath.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is None or stat.st_size == 0:
+            self.initialize()
+            stat = self.filepath.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+
+        # Typed columns and date parsing come straight out of the parser in one pass
+        df = pd.read_csv(
+            self.filepath,
+            engine=CSV_ENGINE,
+            dtype=self.dtypes,
+            parse_dates=["date"],
+            date_format=ISO_FORMAT,
+        )
+        if not df.empty:
+            # read_csv leaves the column unparsed if any row is not ISO: accept legacy
+            # dd-mm-yyyy rows written by older versions and coerce anything else to NaT
+            if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+                df["date"] = self._parse_dates(df["date"])
+            df = df.dropna(subset=["date"])
+            # add_entries keeps the file sorted, so this only sorts legacy or hand-edited files
+            if not df["date"].is_monotonic_increasing:
+                df = df.sort_values("date", kind="stable")
+
+        self._cache = (key, df)
+        return df
+
+    @staticmethod
+    def _parse_dates(raw):
+        """Parses ISO or legacy dd-mm-yyyy date strings; anything else becomes NaT."""
+        return pd.to_datetime(raw, format=ISO_FORMAT, errors="coerce").fillna(
+            pd.to_datetime(raw, format=DISPLAY_FORMAT, errors="coerce")
+        )
+
+    def export_csv(self, filename):
+        """Exports all transactions as a CSV file with ISO dates."""
+        df = self.get_transactions_df()
+        df.to_csv(filename, index=False, date_format=ISO_FORMAT, float_format="%.2f")
+        print(f"Exported {len(df)} transactions to {filename}")
 
     def get_transactions(self, start_date, end_date):
         df = self.get_transactions_df(start_date, end_date)
@@ -88,10 +348,21 @@ class TransactionStore:
             return df
 
         print(f"\nTransactions from {start_date} to {end_date}")
-        print(df.to_string(index=False, formatters={"date": lambda x: x.strftime(DATE_FORMAT)}))
+        # Dates are formatted in one vectorized call and the listing is written in one go,
+        # rather than passing every cell through DataFrame.to_string's aligning formatter
+        rows = zip(
+            df["date"].dt.strftime(DISPLAY_FORMAT).to_numpy(),
+            df["amount"].to_numpy(),
+            df["category"].to_numpy(),
+            df["description"].fillna("").to_numpy(),
+        )
+        lines = [f"{'date':<12}{'amount':>10}  {'category':<8}  description"]
+        lines += [f"{d:<12}{a:>10.2f}  {c:<8}  {desc}" for d, a, c, desc in rows]
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        total_income = df[df["category"] == Category.INCOME.value]["amount"].sum()
-        total_expense = df[df["category"] == Category.EXPENSE.value]["amount"].sum()
+        totals = category_totals(df)
+        total_income = totals[Category.INCOME.value]
+        total_expense = totals[Category.EXPENSE.value]
         print("\nSummary:")
         print(f"Total income: ${total_income:.2f}")
         print(f"Total expense: ${total_expense:.2f}")
@@ -100,14 +371,79 @@ class TransactionStore:
         return df
 
 
+@dataclass
+class DerivedFrame:
+    """A filtered transactions frame plus the aggregates the charts share, each computed once on first use."""
+
+    df: pd.DataFrame
+
+    @property
+    def empty(self):
+        return self.df.empty
+
+    @cached_property
+    def sorted_df(self):
+        """The frame in date order, sorted once for every chart (store reads already are)."""
+        df = self.df
+        return df if df["date"].is_monotonic_increasing else df.sort_values("date", kind="stable")
+
+    @cached_property
+    def cumulative(self):
+        """Running savings in date order, indexed like sorted_df."""
+        sorted_df = self.sorted_df
+        sign = np.where((sorted_df["category"] == Category.INCOME.value).to_numpy(), 1.0, -1.0)
+        return pd.Series(
+            (sorted_df["amount"].to_numpy() * sign).cumsum(), index=sorted_df.index, name="cumulative"
+        )
+
+    @cached_property
+    def by_category(self):
+        """Total amount per category, in Category order (zero for a category with no rows)."""
+        return category_totals(self.df)
+
+    @cached_property
+    def daily(self):
+        return self.df.groupby(["date", "category"], observed=True)["amount"].sum().reset_index()
+
+    @cached_property
+    def grouped(self):
+        """Totals per (month, category, description) from a single pass over the rows.
+
+        The monthly and per-description views below are marginals of this small result, so the
+        full frame is hashed once rather than once per chart.
+        """
+        # Group on int64-backed Periods; month labels are stringified only once they are unique
+        months = self.df["date"].dt.to_period("M").rename("month")
+        return self.df.groupby(
+            [months, "category", "description"], observed=True, dropna=False
+        )["amount"].sum()
+
+    @cached_property
+    def monthly(self):
+        monthly = self.grouped.groupby(level=["month", "category"], observed=True).sum().reset_index()
+        monthly["month"] = monthly["month"].astype(str)
+        return monthly
+
+    @cached_property
+    def by_description(self):
+        # Transactions without a description are left out of the breakdowns, as before
+        return self.grouped.groupby(level=["category", "description"], observed=True).sum()
+
+    def description_totals(self, category):
+        """Total amount per description within one category."""
+        by_desc = self.by_description
+        in_category = by_desc.index.get_level_values("category") == category
+        return by_desc[in_category].droplevel("category").reset_index()
+
+
 class Visualizer:
-    """Handles all Plotly visualizations for financial data."""
+    """Handles all Plotly visualizations for financial data; each chart takes a DerivedFrame."""
 
     @staticmethod
     @requires_data
-    def income_vs_expense_bar(df):
+    def income_vs_expense_bar(data):
         """Bar chart comparing total income vs expense."""
-        summary = df.groupby("category")["amount"].sum().reset_index()
+        summary = data.by_category.reset_index()
 
         fig = px.bar(
             summary,
@@ -119,16 +455,14 @@ class Visualizer:
             labels={"amount": "Amount ($)", "category": "Category"},
         )
         fig.update_layout(showlegend=False)
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
     @requires_data
-    def spending_over_time(df):
+    def spending_over_time(data):
         """Line chart showing income and expenses over time."""
-        daily = df.groupby(["date", "category"])["amount"].sum().reset_index()
-
         fig = px.line(
-            daily,
+            data.daily,
             x="date",
             y="amount",
             color="category",
@@ -137,19 +471,14 @@ class Visualizer:
             labels={"amount": "Amount ($)", "date": "Date"},
             markers=True,
         )
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
     @requires_data
-    def monthly_summary(df):
+    def monthly_summary(data):
         """Bar chart showing monthly income vs expense."""
-        df = df.copy()
-        df["month"] = df["date"].dt.to_period("M").astype(str)
-
-        monthly = df.groupby(["month", "category"])["amount"].sum().reset_index()
-
         fig = px.bar(
-            monthly,
+            data.monthly,
             x="month",
             y="amount",
             color="category",
@@ -158,19 +487,17 @@ class Visualizer:
             title="Monthly Income vs Expense",
             labels={"amount": "Amount ($)", "month": "Month"},
         )
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
     @requires_data
-    def category_pie_chart(df, category=Category.EXPENSE.value):
+    def category_pie_chart(data, category=Category.EXPENSE.value):
         """Pie chart showing breakdown by description for a category."""
-        filtered = df[df["category"] == category]
-        if filtered.empty:
+        by_desc = data.description_totals(category)
+        if by_desc.empty:
             print(f"No {category.lower()} data to visualize.")
             return
 
-        by_desc = filtered.groupby("description")["amount"].sum().reset_index()
-
         fig = px.pie(
             by_desc,
             values="amount",
@@ -178,22 +505,15 @@ class Visualizer:
             title=f"{category} Breakdown by Description",
             hole=0.4,
         )
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
     @requires_data
-    def cumulative_savings(df):
+    def cumulative_savings(data):
         """Line chart showing cumulative savings over time."""
-        df = df.copy().sort_values("date")
-        df["signed_amount"] = df["amount"].where(
-            df["category"] == Category.INCOME.value, -df["amount"]
-        )
-        df["cumulative"] = df["signed_amount"].cumsum()
-
         fig = px.area(
-            df,
-            x="date",
-            y="cumulative",
+            x=data.sorted_df["date"],
+            y=data.cumulative,
             title="Cumulative Savings Over Time",
             labels={"cumulative": "Savings ($)", "date": "Date"},
         )
@@ -201,21 +521,14 @@ class Visualizer:
             line_color=COLORS["savings"],
             fillcolor="rgba(52, 152, 219, 0.3)",
         )
-        fig.show()
+        show_figure(fig)
 
     @staticmethod
     @requires_data
-    def dashboard(df):
+    def dashboard(data):
         """Full dashboard with multiple charts."""
-        df = df.copy()
-        df["month"] = df["date"].dt.to_period("M").astype(str)
-        df["signed_amount"] = df["amount"].where(
-            df["category"] == Category.INCOME.value, -df["amount"]
-        )
-        df["cumulative"] = df.sort_values("date")["signed_amount"].cumsum()
-
-        total_income = df[df["category"] == Category.INCOME.value]["amount"].sum()
-        total_expense = df[df["category"] == Category.EXPENSE.value]["amount"].sum()
+        total_income = data.by_category[Category.INCOME.value]
+        total_expense = data.by_category[Category.EXPENSE.value]
         net_savings = total_income - total_expense
 
         fig = make_subplots(
@@ -234,12 +547,12 @@ class Visualizer:
         )
 
         # Income vs Expense bar
-        summary = df.groupby("category")["amount"].sum().reset_index()
-        colors = [COLORS.get(c, "#999999") for c in summary["category"]]
+        summary = data.by_category
+        colors = [COLORS.get(c, "#999999") for c in summary.index]
         fig.add_trace(
             go.Bar(
-                x=summary["category"],
-                y=summary["amount"],
+                x=summary.index,
+                y=summary.to_numpy(),
                 marker_color=colors,
                 name="Total",
             ),
@@ -248,11 +561,10 @@ class Visualizer:
         )
 
         # Cumulative savings line
-        sorted_df = df.sort_values("date")
         fig.add_trace(
             go.Scatter(
-                x=sorted_df["date"],
-                y=sorted_df["cumulative"],
+                x=data.sorted_df["date"],
+                y=data.cumulative,
                 mode="lines+markers",
                 name="Savings",
                 line={"color": COLORS["savings"]},
@@ -263,7 +575,7 @@ class Visualizer:
         )
 
         # Monthly breakdown
-        monthly = df.groupby(["month", "category"])["amount"].sum().reset_index()
+        monthly = data.monthly
         for cat in Category:
             cat_data = monthly[monthly["category"] == cat.value]
             fig.add_trace(
@@ -278,9 +590,8 @@ class Visualizer:
             )
 
         # Expense pie chart
-        expenses = df[df["category"] == Category.EXPENSE.value]
-        if not expenses.empty:
-            by_desc = expenses.groupby("description")["amount"].sum().reset_index()
+        by_desc = data.description_totals(Category.EXPENSE.value)
+        if not by_desc.empty:
             fig.add_trace(
                 go.Pie(
                     labels=by_desc["description"],
@@ -299,7 +610,7 @@ class Visualizer:
             ),
             showlegend=True,
         )
-        fig.show()
+        show_figure(fig)
 
 
 # Data entry functions
@@ -307,14 +618,18 @@ def get_date(prompt, allow_default=False):
     while True:
         date_str = input(f"{prompt}: ").strip()
         if allow_default and date_str == "":
-            today = datetime.today().strftime(DATE_FORMAT)
+            today = datetime.today().strftime(DISPLAY_FORMAT)
             print(f"Using today's date: {today}")
             return today
-        try:
-            parsed = datetime.strptime(date_str, DATE_FORMAT)
-            return parsed.strftime(DATE_FORMAT)
-        except ValueError:
-            print("Invalid date format. Please use dd-mm-yyyy (e.g., 19-12-2025)")
+        match = DATE_RE.match(date_str)
+        if match:
+            day, month, year = map(int, match.groups())
+            try:
+                datetime(year, month, day)  # rejects impossible dates such as 30-02
+                return f"{day:02d}-{month:02d}-{year:04d}"
+            except ValueError:
+                pass
+        print("Invalid date format. Please use dd-mm-yyyy (e.g., 19-12-2025)")
 
 
 def get_amount():
@@ -361,14 +676,16 @@ def visualize_menu(store):
         print("No data to visualize for this date range.")
         return
 
+    # Shared aggregates are computed on first use and reused by every chart below
+    data = DerivedFrame(df)
     menu_options = {
-        "1": ("Income vs Expense (Bar)", lambda: Visualizer.income_vs_expense_bar(df)),
-        "2": ("Transactions Over Time (Line)", lambda: Visualizer.spending_over_time(df)),
-        "3": ("Monthly Summary (Bar)", lambda: Visualizer.monthly_summary(df)),
-        "4": ("Expense Breakdown (Pie)", lambda: Visualizer.category_pie_chart(df, Category.EXPENSE.value)),
-        "5": ("Income Breakdown (Pie)", lambda: Visualizer.category_pie_chart(df, Category.INCOME.value)),
-        "6": ("Cumulative Savings (Area)", lambda: Visualizer.cumulative_savings(df)),
-        "7": ("Full Dashboard", lambda: Visualizer.dashboard(df)),
+        "1": ("Income vs Expense (Bar)", lambda: Visualizer.income_vs_expense_bar(data)),
+        "2": ("Transactions Over Time (Line)", lambda: Visualizer.spending_over_time(data)),
+        "3": ("Monthly Summary (Bar)", lambda: Visualizer.monthly_summary(data)),
+        "4": ("Expense Breakdown (Pie)", lambda: Visualizer.category_pie_chart(data, Category.EXPENSE.value)),
+        "5": ("Income Breakdown (Pie)", lambda: Visualizer.category_pie_chart(data, Category.INCOME.value)),
+        "6": ("Cumulative Savings (Area)", lambda: Visualizer.cumulative_savings(data)),
+        "7": ("Full Dashboard", lambda: Visualizer.dashboard(data)),
     }
 
     while True:
@@ -388,7 +705,8 @@ def visualize_menu(store):
 
 
 def main():
-    store = TransactionStore()
+    # An optional argument picks the data file, e.g. `python main.py finance_data.parquet`
+    store = TransactionStore(*sys.argv[1:2])
     store.initialize()
 
     menu_options = {